@@ -4,66 +4,111 @@ CLI entry point for Account Brief Generator.
 """
 
 import argparse
+import asyncio
+import os
 import re
 import sys
 from pathlib import Path
+from typing import List
 
 from src.renderer import render_account_brief
 
+# Single-pass translation table for the common all-ASCII case, built once
+# at import time: whitespace (including the C0 separators \x1c-\x1f) maps
+# to '-', other punctuation and control characters are dropped, and
+# letters, digits, '-' and '_' pass through. Non-ASCII input goes through
+# the original regex pair instead, which keeps international letters while
+# stripping Unicode punctuation (smart quotes, en-dashes, symbols).
+_SANITIZE_TABLE = {i: None for i in range(128)
+                   if not (chr(i).isalnum() or chr(i) in '-_' or chr(i).isspace())}
+_SANITIZE_TABLE.update({i: ord('-') for i in range(128) if chr(i).isspace()})
+
+_NON_WORD_RE = re.compile(r'[^\w\s-]')
+_SEPARATOR_RE = re.compile(r'[-\s]+')
+
 
 def sanitize_filename(company: str) -> str:
     """
     Sanitize company name for use as a filename.
-    
+
     Args:
         company: Company name
-        
+
     Returns:
         Sanitized filename-safe string
     """
-    # Replace spaces and special characters with hyphens
-    sanitized = re.sub(r'[^\w\s-]', '', company)
-    sanitized = re.sub(r'[-\s]+', '-', sanitized)
+    if company.isascii():
+        # Replace spaces and special characters with hyphens in one pass
+        sanitized = company.translate(_SANITIZE_TABLE)
+        # Collapse runs of hyphens left by adjacent separators
+        while '--' in sanitized:
+            sanitized = sanitized.replace('--', '-')
+    else:
+        sanitized = _SEPARATOR_RE.sub('-', _NON_WORD_RE.sub('', company))
     # Remove leading/trailing hyphens
     sanitized = sanitized.strip('-')
     # Fallback if empty
     return sanitized if sanitized else "company"
 
 
+# Last-seen (directory mtime, max version) per company directory, so
+# repeated briefs for the same company in one process skip the rescan.
+# The mtime check invalidates the entry if anything else touched the dir.
+_VERSION_CACHE = {}
+
+
+def _record_version(company_dir: Path, version: int) -> None:
+    """Remember the version just written so the next call skips the scan."""
+    try:
+        _VERSION_CACHE[company_dir] = (company_dir.stat().st_mtime_ns, version)
+    except OSError:
+        _VERSION_CACHE.pop(company_dir, None)
+
+
 def get_next_version(company_dir: Path, company_name: str) -> int:
     """
     Get the next version number for a company's account briefs.
-    
+
     Args:
         company_dir: Path to the company's directory
         company_name: Sanitized company name
-        
+
     Returns:
         Next version number (1 if no existing versions)
     """
-    if not company_dir.exists():
-        return 1
-    
-    # Find all existing version files
-    pattern = f"{company_name}-v*.md"
-    existing_files = list(company_dir.glob(pattern))
-    
-    if not existing_files:
+    # A missing directory means no prior briefs
+    try:
+        mtime_ns = company_dir.stat().st_mtime_ns
+    except OSError:
         return 1
-    
-    # Extract version numbers
-    versions = []
-    version_pattern = re.compile(rf"{re.escape(company_name)}-v(\d+)\.md")
-    
-    for file in existing_files:
-        match = version_pattern.match(file.name)
-        if match:
-            versions.append(int(match.group(1)))
-    
-    if not versions:
+
+    cached = _VERSION_CACHE.get(company_dir)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1] + 1
+
+    # Scan raw directory entries and parse version numbers from the names
+    # directly - avoids building a Path object per file like glob would
+    prefix = f"{company_name}-v"
+    max_ver = 0
+
+    try:
+        entries = os.scandir(company_dir)
+    except FileNotFoundError:
         return 1
-    
-    return max(versions) + 1
+
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(prefix) and name.endswith(".md"):
+                try:
+                    version = int(name[len(prefix):-3])
+                except ValueError:
+                    continue
+                if version > max_ver:
+                    max_ver = version
+
+    _VERSION_CACHE[company_dir] = (mtime_ns, max_ver)
+    return max_ver + 1
 
 
 def get_output_path(company: str) -> Path:
@@ -95,6 +140,76 @@ def get_output_path(company: str) -> Path:
     return company_dir / filename
 
 
+def generate_brief(company: str, persona: str, competitors: List[str],
+                   use_research: bool, use_llm: bool, llm_provider: str) -> Path:
+    """
+    Generate one account brief and write it to its versioned output path.
+
+    Args:
+        company: Company name
+        persona: Target persona
+        competitors: List of competitor names
+        use_research: Whether to use web research
+        use_llm: Whether to use LLM enhancement
+        llm_provider: LLM provider ("openai" or "anthropic")
+
+    Returns:
+        Path the brief was written to
+    """
+    brief = render_account_brief(
+        company=company,
+        persona=persona,
+        competitors=competitors,
+        use_research=use_research,
+        use_llm=use_llm,
+        llm_provider=llm_provider
+    )
+
+    output_file = get_output_path(company)
+
+    # Write to a temp file then rename so an interrupted run never
+    # leaves a half-written brief behind
+    tmp_file = output_file.with_suffix('.md.tmp')
+    tmp_file.write_bytes(brief.encode('utf-8'))
+    tmp_file.replace(output_file)
+
+    # Pre-populate the version cache with the file we just wrote so the
+    # next brief for this company doesn't rescan the directory
+    _record_version(output_file.parent, int(output_file.stem.rsplit('-v', 1)[1]))
+
+    return output_file
+
+
+async def generate_briefs_bulk(companies: List[str], persona: str, competitors: List[str],
+                               use_research: bool, use_llm: bool, llm_provider: str,
+                               concurrency: int = 8) -> List:
+    """
+    Generate briefs for many companies concurrently in one process.
+
+    Each brief still renders synchronously, but runs on a worker thread so
+    the LLM/network round-trips for up to `concurrency` companies overlap
+    instead of paying per-company process startup and serial latency.
+
+    Returns:
+        Per-company results in first-occurrence order: an output Path or
+        the exception raised for that company. Duplicate names are dropped
+        before fanning out - two workers on the same company would race
+        version allocation in its output directory and overwrite each
+        other's brief.
+    """
+    companies = list(dict.fromkeys(companies))
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one(company: str):
+        async with sem:
+            return await asyncio.to_thread(
+                generate_brief, company, persona, competitors,
+                use_research, use_llm, llm_provider
+            )
+
+    return await asyncio.gather(*(_one(c) for c in companies), return_exceptions=True)
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -110,10 +225,17 @@ Examples:
     parser.add_argument(
         "--company", "-c",
         type=str,
-        required=True,
+        default=None,
         help="Company name"
     )
-    
+
+    parser.add_argument(
+        "--companies-file",
+        type=str,
+        default=None,
+        help="Path to a newline-delimited file of company names; briefs are generated concurrently in one process"
+    )
+
     parser.add_argument(
         "--persona", "-p",
         type=str,
@@ -142,28 +264,46 @@ Examples:
     )
     
     args = parser.parse_args()
-    
+
+    if not args.company and not args.companies_file:
+        parser.error("one of --company or --companies-file is required")
+
     # Parse competitors from comma-separated string
     competitors = [c.strip() for c in args.competitor.split(",")] if args.competitor else ["Unknown"]
-    
+
+    use_research = not args.no_research
+    use_llm = args.llm is not None
+    llm_provider = args.llm or "openai"
+
+    if args.companies_file:
+        companies = [line.strip() for line in Path(args.companies_file).read_text(encoding='utf-8').splitlines() if line.strip()]
+        # Same dedupe generate_briefs_bulk applies, so results zip back up
+        # against this list one-to-one
+        companies = list(dict.fromkeys(companies))
+        results = asyncio.run(generate_briefs_bulk(
+            companies, args.persona, competitors, use_research, use_llm, llm_provider
+        ))
+
+        failed = False
+        for company, result in zip(companies, results):
+            if isinstance(result, Exception):
+                failed = True
+                print(f"Error generating account brief for {company}: {result}", file=sys.stderr)
+            else:
+                print(f"Account brief saved to: {result}", file=sys.stderr)
+
+        if failed:
+            sys.exit(1)
+        return
+
     try:
-        brief = render_account_brief(
-            company=args.company,
-            persona=args.persona,
-            competitors=competitors,
-            use_research=not args.no_research,
-            use_llm=args.llm is not None,
-            llm_provider=args.llm or "openai"
+        output_file = generate_brief(
+            args.company, args.persona, competitors,
+            use_research, use_llm, llm_provider
         )
-        
-        # Get output path with versioning
-        output_file = get_output_path(args.company)
-        
-        # Write to file
-        output_file.write_text(brief, encoding='utf-8')
-        
+
         print(f"Account brief saved to: {output_file}", file=sys.stderr)
-        
+
     except Exception as e:
         print(f"Error generating account brief: {e}", file=sys.stderr)
         sys.exit(1)
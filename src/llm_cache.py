@@ -0,0 +1,88 @@
+"""
+Persistent response cache for LLM research calls.
+
+Keys are content-addressed (SHA256 of provider + model + prompt), so
+repeated runs for the same company skip the API round-trip and token cost
+entirely. Entries live as JSON files under outputs/.llm_cache and expire
+based on file mtime.
+"""
+
+import hashlib
+import time
+from pathlib import Path
+from typing import Optional
+
+# orjson parses/serializes these few-KB payloads several times faster than
+# stdlib json and produces bytes directly; fall back to stdlib if missing
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(value) -> bytes:
+        return orjson.dumps(value)
+except ImportError:
+    import json
+
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(value) -> bytes:
+        return json.dumps(value).encode('utf-8')
+
+CACHE_DIR = Path("outputs/.llm_cache")
+
+# Company/persona research goes stale slowly; a day is a safe default
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+
+def make_key(provider: str, model: str, prompt: str) -> str:
+    """
+    Build a content-addressed cache key for an LLM request.
+
+    Args:
+        provider: LLM provider name ("openai" or "anthropic")
+        model: Model identifier
+        prompt: Full prompt text
+
+    Returns:
+        Hex SHA256 digest usable as a filename
+    """
+    return hashlib.sha256((provider + model + prompt).encode()).hexdigest()
+
+
+def get(key: str, ttl: int = DEFAULT_TTL_SECONDS) -> Optional[dict]:
+    """
+    Look up a cached response.
+
+    Args:
+        key: Cache key from make_key
+        ttl: Maximum age in seconds before an entry is considered stale
+
+    Returns:
+        The cached dictionary, or None on miss/stale/unreadable entry
+    """
+    cache_file = CACHE_DIR / f"{key}.json"
+    try:
+        if time.time() - cache_file.stat().st_mtime > ttl:
+            return None
+        return _loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def put(key: str, value: dict) -> None:
+    """
+    Store a response in the cache. Failures are silently ignored - caching
+    is best-effort and must never break brief generation.
+
+    Args:
+        key: Cache key from make_key
+        value: JSON-serializable response dictionary
+    """
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (CACHE_DIR / f"{key}.json").write_bytes(_dumps(value))
+    except (OSError, TypeError, ValueError):
+        pass
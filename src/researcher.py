@@ -2,131 +2,573 @@
 Web research module for gathering account information.
 """
 
+import asyncio
+import atexit
+import os
 import re
-from typing import Dict, List, Optional
+import threading
+import time
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple, Union
+
+def _import_ddgs():
+    """
+    Import duckduckgo_search on first use, caching the result.
+
+    The package drags in a heavy HTTP stack at import time, so deferring
+    it keeps module import cheap for callers that never touch the network
+    (pain points, discovery questions).
+
+    Returns:
+        (DDGS, AsyncDDGS) classes, or None if the package is not installed.
+        AsyncDDGS is None on versions that no longer ship it; callers then
+        degrade to the sync path.
+    """
+    global _ddgs_classes
+    if _ddgs_classes is None:
+        try:
+            from duckduckgo_search import DDGS
+        except ImportError:
+            _ddgs_classes = False
+        else:
+            # AsyncDDGS was removed in newer releases; its absence must not
+            # take the sync path down with it
+            try:
+                from duckduckgo_search import AsyncDDGS
+            except ImportError:
+                AsyncDDGS = None
+            _ddgs_classes = (DDGS, AsyncDDGS)
+    return _ddgs_classes or None
+
+
+def _ratelimit_exception():
+    """The library's rate-limit exception type (Exception on old versions)."""
+    try:
+        from duckduckgo_search.exceptions import RatelimitException
+        return RatelimitException
+    except ImportError:
+        return Exception
+
+
+# The API backend is less rate-limit-prone than the HTML one, so try it
+# first and only fall back on a rate-limit response
+_SEARCH_BACKENDS = ('api', 'html')
+
+
+_ddgs_classes = None  # None = not probed yet, False = unavailable
+
+
+def _ddgs_available() -> bool:
+    """Whether duckduckgo_search can be imported (probed once, cached)."""
+    return _import_ddgs() is not None
+
+# One DDGS instance per process so every query reuses the same underlying
+# HTTP session instead of paying a fresh TCP+TLS handshake per search; the
+# async research path shares a single AsyncDDGS the same way
+_ddgs_lock = threading.Lock()
+_ddgs_singleton = None
+_async_ddgs_singleton = None
+
+
+def _get_ddgs():
+    """Get (lazily creating) the shared DDGS instance."""
+    global _ddgs_singleton
+    with _ddgs_lock:
+        if _ddgs_singleton is None:
+            _ddgs_singleton = _import_ddgs()[0]()
+        return _ddgs_singleton
+
+
+def _get_async_ddgs():
+    """
+    Get (lazily creating) the shared AsyncDDGS instance.
+
+    Returns:
+        The shared AsyncDDGS, or None when this duckduckgo_search version
+        doesn't ship the class (callers degrade to the sync path)
+    """
+    global _async_ddgs_singleton
+    async_cls = _import_ddgs()[1]
+    if async_cls is None:
+        return None
+    with _ddgs_lock:
+        if _async_ddgs_singleton is None:
+            _async_ddgs_singleton = async_cls()
+        return _async_ddgs_singleton
+
+
+def close_search_pool() -> None:
+    """Close the shared DDGS sessions, e.g. on shutdown."""
+    global _ddgs_singleton, _async_ddgs_singleton
+    with _ddgs_lock:
+        if _ddgs_singleton is not None:
+            close = getattr(_ddgs_singleton, "close", None)
+            if close is not None:
+                try:
+                    close()
+                except Exception:
+                    pass
+            _ddgs_singleton = None
+        if _async_ddgs_singleton is not None:
+            close = getattr(_async_ddgs_singleton, "close", None)
+            if close is not None:
+                try:
+                    result = close()
+                    if asyncio.iscoroutine(result):
+                        asyncio.run(result)
+                except Exception:
+                    pass
+            _async_ddgs_singleton = None
+
+
+atexit.register(close_search_pool)
+
+
+# In-memory TTL caches so repeated runs for the same company within one
+# process skip the network entirely (and never burn rate-limit budget).
+# Keys are normalized, entries expire after _CACHE_TTL_SECONDS, and the
+# oldest entry is evicted once a cache fills up.
+_CACHE_TTL_SECONDS = 6 * 60 * 60
+_CACHE_MAX_ENTRIES = 1024
+_search_cache: Dict = {}
+_research_cache: Dict = {}
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _normalize_query(query: str) -> str:
+    """Collapse whitespace and case so equivalent queries share a cache key."""
+    return _WHITESPACE_RE.sub(' ', query.strip().lower())
+
+
+def _cache_get(cache: Dict, key):
+    """Return a live cached value, dropping it if expired."""
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if time.monotonic() > expires_at:
+        cache.pop(key, None)
+        return None
+    return value
+
+
+def _cache_put(cache: Dict, key, value) -> None:
+    """Store a value, evicting the oldest entry if the cache is full."""
+    if len(cache) >= _CACHE_MAX_ENTRIES:
+        cache.pop(next(iter(cache)), None)
+    cache[key] = (time.monotonic() + _CACHE_TTL_SECONDS, value)
+
+
+class _TokenBucket:
+    """
+    Paces outbound searches so bursts never trip DuckDuckGo's block, which
+    kicks in after roughly 5-6 rapid requests. A short queue here beats a
+    multi-minute IP block: sustained throughput stays near the bucket rate
+    instead of collapsing to zero.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self._rate = rate
+        self._burst = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return how long to wait before proceeding."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens >= 0.0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def acquire(self) -> None:
+        """Block until a request token is available."""
+        delay = self._reserve()
+        if delay > 0.0:
+            time.sleep(delay)
+
+    async def aacquire(self) -> None:
+        """Async variant of acquire; sleeps without blocking the loop."""
+        delay = self._reserve()
+        if delay > 0.0:
+            await asyncio.sleep(delay)
+
+
+# Default: one search per two seconds after the initial burst of five;
+# override via DDG_RPS (requests per second)
+_bucket = _TokenBucket(rate=float(os.environ.get('DDG_RPS', '0.5')), burst=5)
+
+
+# Circuit breaker: after _BREAKER_THRESHOLD consecutive search failures
+# (typically DDG rate limiting), skip the network for _BREAKER_COOLDOWN
+# seconds and fail fast instead of stacking doomed requests
+_BREAKER_THRESHOLD = 3
+_BREAKER_COOLDOWN = 60.0
+_breaker = {'fails': 0, 'open_until': 0.0}
 
-try:
-    from duckduckgo_search import DDGS
-    DDGS_AVAILABLE = True
-except ImportError:
-    DDGS_AVAILABLE = False
+
+def _breaker_open() -> bool:
+    """Whether the breaker is currently rejecting searches."""
+    return time.monotonic() < _breaker['open_until']
+
+
+def _breaker_record_success() -> None:
+    """A search succeeded; close the breaker."""
+    _breaker['fails'] = 0
+    _breaker['open_until'] = 0.0
+
+
+def _breaker_record_failure() -> None:
+    """A search failed; open the breaker after enough consecutive failures."""
+    _breaker['fails'] += 1
+    if _breaker['fails'] >= _BREAKER_THRESHOLD:
+        _breaker['open_until'] = time.monotonic() + _BREAKER_COOLDOWN
+
+
+# Output key -> raw DDG result key, shared by the sync and async paths
+_RESULT_KEYS = (('title', 'title'), ('url', 'href'), ('body', 'body'))
+
+
+def _normalize_result(result: Dict) -> Dict[str, str]:
+    """Map a raw DDG result onto the keys the rest of the pipeline uses."""
+    # Bind the method once instead of re-resolving it per key
+    get = result.get
+    return {out_key: get(raw_key, '') for out_key, raw_key in _RESULT_KEYS}
 
 
 def search_web(query: str, max_results: int = 5) -> List[Dict[str, str]]:
     """
     Search the web using DuckDuckGo (no API key required).
-    
+
     Args:
         query: Search query string
         max_results: Maximum number of results to return
-        
+
     Returns:
         List of dictionaries with 'title', 'url', and 'body' keys
     """
-    if not DDGS_AVAILABLE:
+    if not _ddgs_available():
         return []
-    
-    try:
-        results = []
-        with DDGS() as ddgs:
-            search_results = ddgs.text(query, max_results=max_results)
-            for result in search_results:
-                results.append({
-                    'title': result.get('title', ''),
-                    'url': result.get('href', ''),
-                    'body': result.get('body', '')
-                })
+
+    cache_key = (_normalize_query(query), max_results)
+    cached = _cache_get(_search_cache, cache_key)
+    if cached is not None:
+        return cached
+
+    if _breaker_open():
+        return []
+
+    _bucket.acquire()
+
+    ratelimit_exc = _ratelimit_exception()
+    last_error = None
+    for backend in _SEARCH_BACKENDS:
+        try:
+            search_results = _get_ddgs().text(query, max_results=max_results, backend=backend)
+            results = [_normalize_result(result) for result in search_results]
+        except ratelimit_exc as e:
+            last_error = e
+            continue
+        except Exception as e:
+            last_error = e
+            break
+        _cache_put(_search_cache, cache_key, results)
+        _breaker_record_success()
         return results
-    except Exception as e:
-        # Try alternative approach if DDGS context manager fails
+
+    _breaker_record_failure()
+    print(f"Warning: Web search failed: {last_error}", file=__import__('sys').stderr)
+    return []
+
+
+async def _search_web_async(ddgs, query: str, max_results: int = 5) -> List[Dict[str, str]]:
+    """
+    Run a single search on a shared AsyncDDGS instance.
+
+    Args:
+        ddgs: AsyncDDGS instance shared across concurrent queries, or None
+            to run the sync search in a worker thread instead
+        query: Search query string
+        max_results: Maximum number of results to return
+
+    Returns:
+        List of dictionaries with 'title', 'url', and 'body' keys
+    """
+    if ddgs is None:
+        # No AsyncDDGS on this install; the sync search still overlaps
+        # across queries when run on worker threads
+        return await asyncio.to_thread(search_web, query, max_results)
+
+    cache_key = (_normalize_query(query), max_results)
+    cached = _cache_get(_search_cache, cache_key)
+    if cached is not None:
+        return cached
+
+    if _breaker_open():
+        return []
+
+    await _bucket.aacquire()
+
+    ratelimit_exc = _ratelimit_exception()
+    last_error = None
+    for backend in _SEARCH_BACKENDS:
         try:
-            ddgs = DDGS()
-            search_results = ddgs.text(query, max_results=max_results)
-            results = []
-            for result in search_results:
-                results.append({
-                    'title': result.get('title', ''),
-                    'url': result.get('href', ''),
-                    'body': result.get('body', '')
-                })
-            return results
-        except Exception as e2:
-            print(f"Warning: Web search failed: {e2}", file=__import__('sys').stderr)
-            return []
-
-
-def research_company(company: str) -> Dict[str, any]:
+            search_results = await ddgs.atext(query, max_results=max_results, backend=backend)
+            results = [_normalize_result(result) for result in search_results or []]
+        except ratelimit_exc as e:
+            last_error = e
+            continue
+        except Exception as e:
+            last_error = e
+            break
+        _cache_put(_search_cache, cache_key, results)
+        _breaker_record_success()
+        return results
+
+    _breaker_record_failure()
+    print(f"Warning: Web search failed: {last_error}", file=__import__('sys').stderr)
+    return []
+
+
+# Hints for sorting fused-query results into the funding/news/description
+# buckets the rest of the pipeline expects
+_FUNDING_HINT_RE = re.compile(r'\b(funding|raised|series [a-e]|investment|investors?|valuation|\$\d)', re.I)
+_NEWS_HINT_RE = re.compile(r'\b(news|announc\w*|launch\w*|partner\w*|releas\w*|20\d\d)\b', re.I)
+
+
+def _classify_snippet(body: str) -> str:
+    """
+    Classify a search result snippet into a research bucket.
+
+    Args:
+        body: Result title and body text
+
+    Returns:
+        One of 'funding', 'news', or 'description'
+    """
+    if _FUNDING_HINT_RE.search(body):
+        return 'funding'
+    if _NEWS_HINT_RE.search(body):
+        return 'news'
+    return 'description'
+
+
+class ResearchData:
+    """
+    Research payload for one company.
+
+    __slots__ drops the per-instance __dict__, shrinking the footprint and
+    speeding up field access - noticeable in bulk runs that hold hundreds
+    of these at once. Declared by hand rather than via dataclass(slots=True),
+    which needs Python 3.10 while the project supports 3.9.
+    """
+    __slots__ = ('recent_news', 'funding_info', 'hiring_trends',
+                 'description', 'all_snippets', 'combined_text')
+
+    def __init__(self,
+                 recent_news: Optional[List[Dict[str, str]]] = None,
+                 funding_info: Optional[List[Dict[str, str]]] = None,
+                 hiring_trends: Optional[List[Dict[str, str]]] = None,
+                 description: Optional[List[Dict[str, str]]] = None,
+                 all_snippets: Optional[List[str]] = None,
+                 combined_text: str = ''):
+        self.recent_news = recent_news if recent_news is not None else []
+        self.funding_info = funding_info
+        self.hiring_trends = hiring_trends
+        self.description = description
+        self.all_snippets = all_snippets if all_snippets is not None else []
+        self.combined_text = combined_text
+
+
+async def research_company_async(company: str) -> ResearchData:
     """
     Research a company and gather relevant information.
-    
+
+    A single fused query covers news, funding, and company description in
+    one network round-trip; results are sorted into the three buckets
+    locally. Buckets the fused query leaves empty are topped up with just
+    their original split query, run concurrently.
+
     Args:
         company: Company name
-        
+
     Returns:
-        Dictionary with researched information
-    """
-    research_data = {
-        'recent_news': [],
-        'funding_info': None,
-        'hiring_trends': None,
-        'description': None,
-        'all_snippets': []
-    }
-    
-    # Search for recent news
-    news_query = f"{company} news 2024"
-    research_data['recent_news'] = search_web(news_query, max_results=5)
-    
-    # Search for funding information
-    funding_query = f"{company} funding investment raised"
-    funding_results = search_web(funding_query, max_results=3)
-    research_data['funding_info'] = funding_results
-    
-    # Search for company description/about
-    desc_query = f"{company} company about"
-    desc_results = search_web(desc_query, max_results=3)
-    research_data['description'] = desc_results
-    
-    # Collect all snippets for context
-    all_snippets = []
-    for result in research_data['recent_news'] + research_data['funding_info'] + research_data['description']:
-        if result.get('body'):
-            all_snippets.append(result['body'])
-    research_data['all_snippets'] = all_snippets
-    
+        ResearchData with the researched information
+    """
+    cache_key = _normalize_query(company)
+    cached = _cache_get(_research_cache, cache_key)
+    if cached is not None:
+        return cached
+
+    news_results, funding_results, desc_results = [], [], []
+    if _ddgs_available():
+        ddgs = _get_async_ddgs()
+        combined = await _search_web_async(
+            ddgs, f'"{company}" (news OR funding OR raised OR about)', max_results=15
+        )
+        buckets = {
+            'news': news_results,
+            'funding': funding_results,
+            'description': desc_results,
+        }
+        for result in combined:
+            text = f"{result.get('title', '')} {result.get('body', '')}"
+            buckets[_classify_snippet(text)].append(result)
+
+        # Top up only the buckets the fused query missed, keeping its
+        # results; re-running every split query would turn the common case
+        # into four rate-limited calls where the baseline used three
+        fallback_queries = {
+            'news': (f"{company} news 2024", 5),
+            'funding': (f"{company} funding investment raised", 3),
+            'description': (f"{company} company about", 3),
+        }
+        empty = [name for name, bucket in buckets.items() if not bucket]
+        if empty:
+            topped_up = await asyncio.gather(
+                *(_search_web_async(ddgs, fallback_queries[name][0],
+                                    max_results=fallback_queries[name][1])
+                  for name in empty)
+            )
+            for name, extra in zip(empty, topped_up):
+                buckets[name].extend(extra)
+
+    # Collect all snippets for context without concatenating the buckets
+    all_snippets = [
+        body
+        for result in chain(news_results, funding_results, desc_results)
+        if (body := result.get('body'))
+    ]
+    research_data = ResearchData(
+        recent_news=news_results,
+        funding_info=funding_results,
+        description=desc_results,
+        all_snippets=all_snippets,
+        # Join the context snippets once here so every downstream consumer
+        # reads the same string instead of re-joining per call
+        combined_text=' '.join(all_snippets[:5])
+    )
+
+    # Only cache when something actually came back; an all-empty payload
+    # (DDGS missing, breaker open, both backends throttled) would otherwise
+    # pin the company to empty research for the full TTL
+    if news_results or funding_results or desc_results:
+        _cache_put(_research_cache, cache_key, research_data)
     return research_data
 
 
-def extract_why_now_triggers(company: str, research_data: Dict[str, any]) -> List[str]:
+def research_company(company: str) -> ResearchData:
+    """Synchronous wrapper around research_company_async."""
+    return asyncio.run(research_company_async(company))
+
+
+async def research_companies(companies: List[str], concurrency: int = 8) -> List[ResearchData]:
+    """
+    Research many companies concurrently with a bounded fan-out.
+
+    The semaphore keeps at most `concurrency` companies in flight so bulk
+    runs overlap their network round-trips without hammering DuckDuckGo.
+
+    Args:
+        companies: Company names to research
+        concurrency: Maximum number of companies researched at once
+
+    Returns:
+        ResearchData instances in input order
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one(company: str) -> ResearchData:
+        async with sem:
+            return await research_company_async(company)
+
+    return await asyncio.gather(*(_one(c) for c in companies))
+
+
+# Trigger keyword alternations, compiled once at import so each brief pays
+# a single scan per category instead of one substring pass per keyword
+_FUNDING_RE = re.compile(r'funding|raised|investment|series|funded|million|billion|\$', re.I)
+_HIRING_RE = re.compile(r'hiring|expanding|growing|team|openings|jobs|recruiting', re.I)
+_LAUNCH_RE = re.compile(r'launch|partnership|announces|introduces|new product|release', re.I)
+
+_TRIGGER_RES = (('funding', _FUNDING_RE), ('hiring', _HIRING_RE), ('launch', _LAUNCH_RE))
+
+_TRIGGER_KEYWORDS = {
+    'funding': ('funding', 'raised', 'investment', 'series', 'funded', 'million', 'billion', '$'),
+    'hiring': ('hiring', 'expanding', 'growing', 'team', 'openings', 'jobs', 'recruiting'),
+    'launch': ('launch', 'partnership', 'announces', 'introduces', 'new product', 'release'),
+}
+
+# Optional: pyahocorasick finds every category's keywords in one pass over
+# the text, which pays off in bulk runs; the regex scans remain the fallback
+try:
+    import ahocorasick
+
+    _TRIGGER_AUTOMATON = ahocorasick.Automaton()
+    for _category, _keywords in _TRIGGER_KEYWORDS.items():
+        for _keyword in _keywords:
+            _TRIGGER_AUTOMATON.add_word(_keyword, _category)
+    _TRIGGER_AUTOMATON.make_automaton()
+except ImportError:
+    _TRIGGER_AUTOMATON = None
+
+
+def _trigger_categories(combined_text: str) -> set:
+    """
+    Find which trigger categories appear in the combined snippet text.
+
+    Args:
+        combined_text: Joined research snippets
+
+    Returns:
+        Set of category names ('funding', 'hiring', 'launch')
+    """
+    if _TRIGGER_AUTOMATON is not None:
+        # Automaton keywords are lowercase, so lower the haystack here
+        return {category for _, category in _TRIGGER_AUTOMATON.iter(combined_text.lower())}
+    return {category for category, pattern in _TRIGGER_RES if pattern.search(combined_text)}
+
+
+def extract_why_now_triggers(company: str, research_data: Union[ResearchData, Dict[str, any]]) -> List[str]:
     """
     Extract "why now" triggers from research data.
-    
+
     Args:
         company: Company name
-        research_data: Research data dictionary
-        
+        research_data: ResearchData from research_company (plain dicts with
+            the same keys are still accepted for back-compat)
+
     Returns:
         List of trigger statements
     """
     triggers = []
-    snippets = research_data.get('all_snippets', [])
-    
+    if isinstance(research_data, ResearchData):
+        snippets = research_data.all_snippets
+        combined_text = research_data.combined_text
+    else:
+        snippets = research_data.get('all_snippets', [])
+        combined_text = research_data.get('combined_text', '')
+
     if snippets:
-        combined_text = ' '.join(snippets[:5]).lower()  # Use first 5 snippets
-        
-        # Look for funding keywords
-        funding_keywords = ['funding', 'raised', 'investment', 'series', 'funded', 'million', 'billion', '$']
-        if any(keyword in combined_text for keyword in funding_keywords):
+        # Prefer the text research_company already joined; fall back to
+        # joining the first 5 snippets for callers that built their own dict
+        combined_text = combined_text or ' '.join(snippets[:5])
+        hits = _trigger_categories(combined_text)
+
+        if 'funding' in hits:
             triggers.append(f"{company} has recent funding activity indicating growth and investment in new solutions")
-        
-        # Look for hiring/expansion keywords
-        hiring_keywords = ['hiring', 'expanding', 'growing', 'team', 'openings', 'jobs', 'recruiting']
-        if any(keyword in combined_text for keyword in hiring_keywords):
+
+        if 'hiring' in hits:
             triggers.append(f"Active hiring and team expansion at {company} suggests scaling and infrastructure needs")
-        
-        # Look for partnership/launch keywords
-        launch_keywords = ['launch', 'partnership', 'announces', 'introduces', 'new product', 'release']
-        if any(keyword in combined_text for keyword in launch_keywords):
+
+        if 'launch' in hits:
             triggers.append(f"Recent product launches or partnerships at {company} indicate active development")
     
     # Only add generic fallback if no triggers found (avoid generic phrases)
@@ -140,77 +582,113 @@ def extract_why_now_triggers(company: str, research_data: Dict[str, any]) -> Lis
     return triggers[:3]  # Return top 3
 
 
-def get_persona_pain_points(persona: str) -> List[str]:
+# Alias -> canonical role key, so common persona spellings resolve with a
+# single dict lookup instead of a substring scan over every role
+_PERSONA_ALIASES = {
+    'cto': 'cto',
+    'chief technology officer': 'cto',
+    'vp engineering': 'vp engineering',
+    'vp of engineering': 'vp engineering',
+    'vice president of engineering': 'vp engineering',
+    'head of engineering': 'vp engineering',
+    'vp sales': 'vp sales',
+    'vp of sales': 'vp sales',
+    'vice president of sales': 'vp sales',
+    'head of sales': 'vp sales',
+}
+
+# Strip punctuation/digits so "V.P. Engineering" normalizes to "vp engineering"
+_PERSONA_NORM_RE = re.compile(r'[^a-z ]')
+
+# Static pain points by role type, built once at import. Tuples plus the
+# read-only mapping view mean callers can share these without any risk of
+# one brief's mutation leaking into the next
+_PAIN_POINTS_MAP = MappingProxyType({
+    'cto': (
+        "Balancing technical debt with innovation and new feature development",
+        "Scaling infrastructure and engineering teams while maintaining code quality",
+        "Ensuring security and compliance without slowing down development velocity",
+        "Managing vendor relationships and tool sprawl across engineering stack",
+        "Attracting and retaining top engineering talent in competitive market"
+    ),
+    'vp engineering': (
+        "Optimizing team productivity and delivery velocity",
+        "Managing technical debt and architectural decisions at scale",
+        "Balancing feature development with infrastructure improvements",
+        "Cross-team collaboration and communication challenges",
+        "Tool and process standardization across engineering teams"
+    ),
+    'vp sales': (
+        "Accelerating sales cycle and improving win rates",
+        "Forecasting accuracy and pipeline management",
+        "Sales team productivity and quota attainment",
+        "Competitive differentiation and positioning",
+        "Sales and marketing alignment"
+    )
+})
+
+
+@lru_cache(maxsize=128)
+def _generic_pain_points(persona: str) -> Tuple[str, ...]:
+    """Build the generic fallback pain points once per persona."""
+    return (
+        f"Common {persona} challenges around strategic decision-making",
+        f"{persona} pain points related to team and resource management",
+        f"Budget and ROI concerns facing {persona}s",
+        f"{persona} frustrations with current tools and processes",
+        f"Business impact of unresolved challenges for {persona} role"
+    )
+
+
+def get_persona_pain_points(persona: str) -> Tuple[str, ...]:
     """
     Get common pain points for a persona/role.
-    
+
     Args:
         persona: Persona/role name (e.g., "CTO", "VP Engineering")
-        
+
     Returns:
-        List of common pain points
-    """
-    # Generic pain points by role type
-    pain_points_map = {
-        'cto': [
-            "Balancing technical debt with innovation and new feature development",
-            "Scaling infrastructure and engineering teams while maintaining code quality",
-            "Ensuring security and compliance without slowing down development velocity",
-            "Managing vendor relationships and tool sprawl across engineering stack",
-            "Attracting and retaining top engineering talent in competitive market"
-        ],
-        'vp engineering': [
-            "Optimizing team productivity and delivery velocity",
-            "Managing technical debt and architectural decisions at scale",
-            "Balancing feature development with infrastructure improvements",
-            "Cross-team collaboration and communication challenges",
-            "Tool and process standardization across engineering teams"
-        ],
-        'vp sales': [
-            "Accelerating sales cycle and improving win rates",
-            "Forecasting accuracy and pipeline management",
-            "Sales team productivity and quota attainment",
-            "Competitive differentiation and positioning",
-            "Sales and marketing alignment"
-        ]
-    }
-    
-    # Try to match persona (case-insensitive)
+        Tuple of common pain points
+    """
+    # Exact alias hit is O(1); fall back to the substring scan for titles
+    # the alias table doesn't cover (e.g. "Acting CTO")
     persona_lower = persona.lower()
-    for key, points in pain_points_map.items():
+    normalized = _PERSONA_NORM_RE.sub('', persona_lower)
+    normalized = _WHITESPACE_RE.sub(' ', normalized).strip()
+    canonical = _PERSONA_ALIASES.get(normalized)
+    if canonical is not None:
+        return _PAIN_POINTS_MAP[canonical]
+
+    for key, points in _PAIN_POINTS_MAP.items():
         if key in persona_lower:
             return points
-    
-    # Default generic pain points
-    return [
-        f"Common {persona} challenges around strategic decision-making",
-        f"{persona} pain points related to team and resource management",
-        f"Budget and ROI concerns facing {persona}s",
-        f"{persona} frustrations with current tools and processes",
-        f"Business impact of unresolved challenges for {persona} role"
-    ]
+
+    return _generic_pain_points(persona)
+
+
+@lru_cache(maxsize=128)
+def _discovery_questions(persona: str, company: str, competitors_text: str) -> tuple:
+    """Build the question tuple once per (persona, company, competitors)."""
+    return (
+        f"What are the biggest challenges you're facing as {persona} at {company} right now?",
+        f"How do you currently handle [key process/need]? What works well and what doesn't?",
+        f"What would need to happen for this to become a priority for your team?",
+        f"Have you evaluated {competitors_text}? What were your thoughts on those?",
+        f"What's your timeline for addressing these challenges? Who else is involved in the decision?"
+    )
 
 
 def generate_discovery_questions(persona: str, company: str, competitors: List[str]) -> List[str]:
     """
     Generate discovery questions based on persona and context.
-    
+
     Args:
         persona: Target persona
         company: Company name
         competitors: List of competitors
-        
+
     Returns:
         List of 5 discovery questions
     """
     competitors_text = ", ".join(competitors) if competitors else "your current solutions"
-    
-    questions = [
-        f"What are the biggest challenges you're facing as {persona} at {company} right now?",
-        f"How do you currently handle [key process/need]? What works well and what doesn't?",
-        f"What would need to happen for this to become a priority for your team?",
-        f"Have you evaluated {competitors_text}? What were your thoughts on those?",
-        f"What's your timeline for addressing these challenges? Who else is involved in the decision?"
-    ]
-    
-    return questions
+    return list(_discovery_questions(persona, company, competitors_text))